@@ -3,7 +3,9 @@ package cmd
 import (
 	"fmt"
 	"os"
+	"runtime"
 	"strings"
+	"sync"
 
 	cdx "github.com/CycloneDX/cyclonedx-go"
 	"github.com/idlab-discover/aibomgen-cli/internal/apperr"
@@ -100,15 +102,10 @@ Example:
 
 		// Read all AIBOMs.
 		mergerUI.StartReadingAIBOMs(len(aibomPaths))
-		var aiboms []*cdx.BOM
-		for i, aibomPath := range aibomPaths {
-			mergerUI.UpdateReadingAIBOM(i, len(aibomPaths), aibomPath)
-			aibom, err := bomio.ReadBOM(aibomPath, "auto")
-			if err != nil {
-				mergerUI.PrintError(fmt.Errorf("failed to read AIBOM %s: %w", aibomPath, err))
-				return err
-			}
-			aiboms = append(aiboms, aibom)
+		aiboms, err := readAIBOMs(aibomPaths, mergerUI)
+		if err != nil {
+			mergerUI.PrintError(err)
+			return err
 		}
 		mergerUI.CompleteReadingAIBOMs(len(aiboms))
 
@@ -141,6 +138,67 @@ Example:
 	},
 }
 
+// readAIBOMs reads every AIBOM path, fanning out over a bounded goroutine.
+// pool for multiple files (each read is independent I/O + decode work).
+// Results keep the order of aibomPaths; the first error (by input order) wins.
+func readAIBOMs(aibomPaths []string, mergerUI *ui.MergerUI) ([]*cdx.BOM, error) {
+	total := len(aibomPaths)
+
+	// No point spinning up a pool for a single file.
+	if total == 1 {
+		mergerUI.UpdateReadingAIBOM(0, total, aibomPaths[0])
+		aibom, err := bomio.ReadBOM(aibomPaths[0], "auto")
+		if err != nil {
+			return nil, fmt.Errorf("failed to read AIBOM %s: %w", aibomPaths[0], err)
+		}
+		return []*cdx.BOM{aibom}, nil
+	}
+
+	numWorkers := runtime.NumCPU()
+	if numWorkers > total {
+		numWorkers = total
+	}
+
+	idxCh := make(chan int, total)
+	for i := range aibomPaths {
+		idxCh <- i
+	}
+	close(idxCh)
+
+	aiboms := make([]*cdx.BOM, total)
+	errs := make([]error, total)
+	var mu sync.Mutex
+	var wg sync.WaitGroup
+	done := 0
+
+	for w := 0; w < numWorkers; w++ {
+		wg.Add(1)
+		go func() {
+			defer wg.Done()
+			for i := range idxCh {
+				aibom, err := bomio.ReadBOM(aibomPaths[i], "auto")
+				mu.Lock()
+				if err != nil {
+					errs[i] = fmt.Errorf("failed to read AIBOM %s: %w", aibomPaths[i], err)
+				} else {
+					aiboms[i] = aibom
+				}
+				mergerUI.UpdateReadingAIBOM(done, total, aibomPaths[i])
+				done++
+				mu.Unlock()
+			}
+		}()
+	}
+	wg.Wait()
+
+	for _, err := range errs {
+		if err != nil {
+			return nil, err
+		}
+	}
+	return aiboms, nil
+}
+
 func init() {
 	mergeCmd.Flags().StringSliceVar(&mergeAIBOMs, "aibom", []string{}, "Path to AIBOM file (can be specified multiple times, required)")
 	mergeCmd.Flags().StringVar(&mergeSBOM, "sbom", "", "Path to SBOM file (required)")
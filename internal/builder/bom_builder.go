@@ -29,7 +29,7 @@ func (b BOMBuilder) Build(ctx BuildContext) (*cdx.BOM, error) {
 	if err := AddMetaTimestamp(bom); err != nil {
 		return nil, err
 	}
-	if err := AddMetaTools(bom, "", GetAIBoMGenVersion()); err != nil {
+	if err := AddMetaTools(bom, "", cachedAIBoMGenVersion()); err != nil {
 		return nil, err
 	}
 
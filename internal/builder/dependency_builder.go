@@ -21,9 +21,12 @@ func AddDependencies(bom *cdx.BOM) {
 		return
 	}
 
-	// Collect dataset BOMRefs.
+	// Collect dataset BOMRefs. The slice is built once, handed to the model.
+	// dependency entry and never mutated afterwards, so no defensive copy is.
+	// needed.
 	var datasetRefs []string
 	if bom.Components != nil {
+		datasetRefs = make([]string, 0, len(*bom.Components))
 		for _, comp := range *bom.Components {
 			if comp.Type == cdx.ComponentTypeData && comp.BOMRef != "" {
 				datasetRefs = append(datasetRefs, comp.BOMRef)
@@ -37,10 +40,7 @@ func AddDependencies(bom *cdx.BOM) {
 	// Model dependency (depends on datasets if present).
 	modelDep := cdx.Dependency{Ref: modelRef}
 	if len(datasetRefs) > 0 {
-		// copy to avoid referencing underlying slice later.
-		cp := make([]string, len(datasetRefs))
-		copy(cp, datasetRefs)
-		modelDep.Dependencies = &cp
+		modelDep.Dependencies = &datasetRefs
 	}
 	deps = append(deps, modelDep)
 
@@ -48,25 +48,10 @@ func InjectSecurityData(bom *cdx.BOM, comp *cdx.Component, entries []fetcher.Sec
 		return
 	}
 
-	// Count flagged files to decide whether vulnerabilities need adding.
-	unsafeCount := 0
-	cautionCount := 0
-	for _, e := range entries {
-		if e.SecurityFileStatus == nil {
-			continue
-		}
-		switch strings.ToLower(e.SecurityFileStatus.Status) {
-		case "unsafe":
-			unsafeCount++
-		case "caution":
-			cautionCount++
-		}
-	}
-
-	if unsafeCount == 0 && cautionCount == 0 {
-		return
-	}
-
+	// Single pass: build vulnerabilities and count flagged files as we go.
+	// instead of walking entries twice. Only unsafe/caution files gate the.
+	// injection (matching the previous counting pre-pass).
+	flagged := 0
 	var vulns []cdx.Vulnerability
 	for _, entry := range entries {
 		if entry.SecurityFileStatus == nil {
@@ -76,11 +61,18 @@ func InjectSecurityData(bom *cdx.BOM, comp *cdx.Component, entries []fetcher.Sec
 		if status == "safe" || status == "unscanned" || status == "" {
 			continue
 		}
+		if status == "unsafe" || status == "caution" {
+			flagged++
+		}
 
 		vuln := buildFileVulnerability(entry, comp, modelID)
 		vulns = append(vulns, vuln)
 	}
 
+	if flagged == 0 {
+		return
+	}
+
 	if len(vulns) == 0 {
 		return
 	}
@@ -6,6 +6,7 @@ import (
 	"os/exec"
 	"runtime/debug"
 	"strings"
+	"sync"
 )
 
 const aibomgenModulePath = "github.com/idlab-discover/aibomgen-cli"
@@ -18,6 +19,22 @@ var (
 
 var readBuildInfo = debug.ReadBuildInfo
 
+var (
+	toolVersionOnce sync.Once
+	toolVersion     string
+)
+
+// cachedAIBoMGenVersion memoizes GetAIBoMGenVersion for the BOM builders.
+// The dev fallback shells out to git, and batch generation builds one BOM.
+// per discovered model, so the version only needs to be resolved once per.
+// process. GetAIBoMGenVersion itself stays uncached.
+func cachedAIBoMGenVersion() string {
+	toolVersionOnce.Do(func() {
+		toolVersion = GetAIBoMGenVersion()
+	})
+	return toolVersion
+}
+
 func GetAIBoMGenVersion() string {
 	// 1) prefer explicit ldflags.
 	if Version != "" && Version != "dev" {
@@ -5,6 +5,7 @@ import (
 	"fmt"
 	"regexp"
 	"strings"
+	"sync"
 
 	yaml "go.yaml.in/yaml/v3"
 )
@@ -146,6 +147,30 @@ func parseModelIndex(mi any, card *ModelReadmeCard) {
 	}
 }
 
+// nextHeadingRe matches any Markdown heading; hoisted so extractSection does.
+// not recompile it on every call (it runs once per section per README).
+var nextHeadingRe = regexp.MustCompile(`^#+\s+.+$`)
+
+// The heading and bullet-label patterns below are parameterised on a fixed.
+// set of strings (the README fetchers always ask for the same sections and.
+// labels), so compiled patterns are cached instead of recompiled for every.
+// README that passes through.
+var (
+	extractReMu    sync.Mutex
+	extractReCache = map[string]*regexp.Regexp{}
+)
+
+func cachedRegexp(pattern string) *regexp.Regexp {
+	extractReMu.Lock()
+	defer extractReMu.Unlock()
+	re, ok := extractReCache[pattern]
+	if !ok {
+		re = regexp.MustCompile(pattern)
+		extractReCache[pattern] = re
+	}
+	return re
+}
+
 func extractSection(markdown string, heading string) string {
 	markdown = strings.ReplaceAll(markdown, "\r\n", "\n")
 	lines := strings.Split(markdown, "\n")
@@ -154,8 +179,7 @@ func extractSection(markdown string, heading string) string {
 	// Example matches:.
 	//   "## Bias, Risks, and Limitations".
 	//   "### Direct Use".
-	headingRe := regexp.MustCompile(fmt.Sprintf(`^#{2,3}\s+%s\s*$`, regexp.QuoteMeta(heading)))
-	nextHeadingRe := regexp.MustCompile(`^#+\s+.+$`)
+	headingRe := cachedRegexp(fmt.Sprintf(`^#{2,3}\s+%s\s*$`, regexp.QuoteMeta(heading)))
 
 	found := false
 	buf := make([]string, 0)
@@ -184,7 +208,7 @@ func extractBulletValue(markdown string, label string) string {
 	// Supports optional bracketed qualifiers in the label part and text between the label and colon.
 	// Pattern handles both: **Label:** (colon inside) and **Label** text: (colon outside).
 	pat := fmt.Sprintf(`(?m)^-\s+\*\*%s(?:\s*\[[^\]]+\])?(?::\*\*|\*\*[^:\n]*:)\s*(.+?)\s*$`, regexp.QuoteMeta(label))
-	re := regexp.MustCompile(pat)
+	re := cachedRegexp(pat)
 	m := re.FindStringSubmatch(markdown)
 	if len(m) < 2 {
 		return ""
@@ -1,6 +1,8 @@
 package metadata
 
 import (
+	"sync"
+
 	"github.com/idlab-discover/aibomgen-cli/internal/fetcher"
 	"github.com/idlab-discover/aibomgen-cli/pkg/aibomgen/scanner"
 
@@ -164,16 +166,26 @@ type DatasetFieldSpec struct {
 	Suggestions []string
 }
 
+var (
+	registryOnce sync.Once
+	registry     []FieldSpec
+)
+
 // Registry is the central registry of all known FieldSpecs.
 // Each spec defines how to apply itself and how to check presence.
 // The registry is used by the BOM builder and completeness checker.
 // It is the single source of truth for what fields we care about.
+// The specs are static, so the slice is built once and shared; callers.
+// iterate it and must not mutate it.
 func Registry() []FieldSpec {
-	specs := make([]FieldSpec, 0, 32)
-	specs = append(specs, componentFields()...)
-	specs = append(specs, evidenceFields()...)
-	specs = append(specs, hfPropFields()...)
-	specs = append(specs, modelCardFields()...)
-	specs = append(specs, securityFields()...)
-	return specs
+	registryOnce.Do(func() {
+		specs := make([]FieldSpec, 0, 32)
+		specs = append(specs, componentFields()...)
+		specs = append(specs, evidenceFields()...)
+		specs = append(specs, hfPropFields()...)
+		specs = append(specs, modelCardFields()...)
+		specs = append(specs, securityFields()...)
+		registry = specs
+	})
+	return registry
 }
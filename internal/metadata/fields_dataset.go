@@ -3,6 +3,7 @@ package metadata
 import (
 	"fmt"
 	"strings"
+	"sync"
 
 	cdx "github.com/CycloneDX/cyclonedx-go"
 )
@@ -13,8 +14,22 @@ type datasetExternalRefsSource struct {
 	DemoURL   string
 }
 
+var (
+	datasetRegistryOnce sync.Once
+	datasetRegistry     []DatasetFieldSpec
+)
+
 // DatasetRegistry returns all dataset field specifications.
+// Like [Registry], the slice is built once and shared; callers iterate it.
+// and must not mutate it.
 func DatasetRegistry() []DatasetFieldSpec {
+	datasetRegistryOnce.Do(func() {
+		datasetRegistry = buildDatasetRegistry()
+	})
+	return datasetRegistry
+}
+
+func buildDatasetRegistry() []DatasetFieldSpec {
 	return []DatasetFieldSpec{
 		{
 			Key:      DatasetName,
@@ -182,16 +182,24 @@ func datasetIDFromPURL(purl string) string {
 // ApplyToDOM merges the vulnerability scan results into the BOM in-place.
 // Existing vulnerabilities with the same BOM-ref are replaced; new ones are appended.
 func ApplyToDOM(bom *cdx.BOM, results []ComponentScanResult) {
-	// Build a set of incoming bom-refs so we can detect replacements.
-	type vulnKey = string
-	incoming := make(map[vulnKey]cdx.Vulnerability)
+	// Index incoming vulnerabilities by BOM-ref in a single pass, keeping the.
+	// scan-result order in a parallel slice: the index answers the replacement.
+	// lookups below, while the slice makes the appended output deterministic.
+	// (ranging over the map produced a random order per run).
+	incoming := make(map[string]int)
+	var ordered []cdx.Vulnerability
 	for _, r := range results {
 		for _, v := range r.Vulnerabilities {
-			incoming[v.BOMRef] = v
+			if i, seen := incoming[v.BOMRef]; seen {
+				ordered[i] = v
+				continue
+			}
+			incoming[v.BOMRef] = len(ordered)
+			ordered = append(ordered, v)
 		}
 	}
 
-	if len(incoming) == 0 {
+	if len(ordered) == 0 {
 		return
 	}
 
@@ -200,17 +208,15 @@ func ApplyToDOM(bom *cdx.BOM, results []ComponentScanResult) {
 	}
 
 	// Replace existing entries that we re-scanned, keep others.
-	var kept []cdx.Vulnerability
+	kept := make([]cdx.Vulnerability, 0, len(*bom.Vulnerabilities)+len(ordered))
 	for _, existing := range *bom.Vulnerabilities {
 		if _, replaced := incoming[existing.BOMRef]; !replaced {
 			kept = append(kept, existing)
 		}
 	}
 
-	// Append all incoming.
-	for _, v := range incoming {
-		kept = append(kept, v)
-	}
+	// Append all incoming, in scan-result order.
+	kept = append(kept, ordered...)
 
 	*bom.Vulnerabilities = kept
 }
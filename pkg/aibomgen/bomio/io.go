@@ -1,6 +1,8 @@
 package bomio
 
 import (
+	"bufio"
+	"bytes"
 	"fmt"
 	"os"
 	"path/filepath"
@@ -14,11 +16,13 @@ import (
 // The format parameter can be "json", "xml", or "auto" (default).
 // If "auto", the format is determined from the file extension.
 func ReadBOM(path string, format string) (*cdx.BOM, error) {
-	f, err := os.Open(path)
+	// Read the whole file up-front: one syscall sized from stat, and the.
+	// decoder consumes an in-memory reader instead of chunked file reads.
+	// (the XML decoder in particular issues many small reads otherwise).
+	data, err := os.ReadFile(path)
 	if err != nil {
 		return nil, err
 	}
-	defer f.Close()
 
 	actual := strings.ToLower(strings.TrimSpace(format))
 	switch actual {
@@ -29,8 +33,10 @@ func ReadBOM(path string, format string) (*cdx.BOM, error) {
 		case ".json":
 			actual = "json"
 		default:
-			// keep existing behavior: default to JSON when not .xml.
-			actual = "json"
+			// No recognised extension: sniff the content instead of guessing.
+			// The file is already in memory, so peeking at the first byte is.
+			// free and avoids a doomed JSON decode of an XML document.
+			actual = sniffFormat(data)
 		}
 	case "json", "xml":
 		// ok.
@@ -44,7 +50,7 @@ func ReadBOM(path string, format string) (*cdx.BOM, error) {
 	}
 
 	bom := new(cdx.BOM)
-	dec := cdx.NewBOMDecoder(f, fileFmt)
+	dec := cdx.NewBOMDecoder(bytes.NewReader(data), fileFmt)
 	if err := dec.Decode(bom); err != nil {
 		return nil, err
 	}
@@ -52,6 +58,23 @@ func ReadBOM(path string, format string) (*cdx.BOM, error) {
 	return bom, nil
 }
 
+// sniffFormat guesses a BOM file format from its raw content: the first.
+// non-whitespace byte is '<' for XML, anything else is treated as JSON.
+// (matching the previous default for extension-less paths).
+func sniffFormat(data []byte) string {
+	for _, b := range data {
+		switch b {
+		case ' ', '\t', '\r', '\n':
+			continue
+		case '<':
+			return "xml"
+		default:
+			return "json"
+		}
+	}
+	return "json"
+}
+
 // WriteBOM writes a BOM to a file in the specified format.
 // The format parameter can be "json", "xml", or "auto" (default).
 // If "auto", the format is determined from the file extension.
@@ -96,11 +119,18 @@ func WriteBOM(bom *cdx.BOM, outputPath string, format string, spec string) error
 	}
 	defer f.Close()
 
-	encoder := cdx.NewBOMEncoder(f, fileFmt)
+	// Buffer the encoder output: the pretty printers emit lots of small.
+	// writes (one per indent/token), and the buffer coalesces them into.
+	// large write syscalls flushed once at the end.
+	w := bufio.NewWriter(f)
+	encoder := cdx.NewBOMEncoder(w, fileFmt)
 	encoder.SetPretty(true)
 
 	if spec == "" {
-		return encoder.Encode(bom)
+		if err := encoder.Encode(bom); err != nil {
+			return err
+		}
+		return w.Flush()
 	}
 
 	sv, ok := ParseSpecVersion(spec)
@@ -117,7 +147,10 @@ func WriteBOM(bom *cdx.BOM, outputPath string, format string, spec string) error
 		stripTagsFromBOM(bom)
 	}
 
-	return encoder.EncodeVersion(bom, sv)
+	if err := encoder.EncodeVersion(bom, sv); err != nil {
+		return err
+	}
+	return w.Flush()
 }
 
 // stripTagsFromBOM removes tags from all components in the BOM.
@@ -48,6 +48,24 @@ func TestParseSpecVersion_AllCases(t *testing.T) {
 	}
 }
 
+func TestSniffFormat(t *testing.T) {
+	tcs := []struct {
+		in   string
+		want string
+	}{
+		{`{"bomFormat":"CycloneDX"}`, "json"},
+		{"\n\t <?xml version=\"1.0\"?><bom/>", "xml"},
+		{"", "json"},
+		{"   ", "json"},
+	}
+
+	for _, tc := range tcs {
+		if got := sniffFormat([]byte(tc.in)); got != tc.want {
+			t.Fatalf("sniffFormat(%q) = %q, want %q", tc.in, got, tc.want)
+		}
+	}
+}
+
 func TestReadBOM_OpenError(t *testing.T) {
 	_, err := ReadBOM(filepath.Join(t.TempDir(), "missing.json"), "auto")
 	if err == nil {
@@ -76,6 +76,10 @@ var newDummyFetcherSet = func() fetcherSet {
 // ProgressCallback is called during generation to report progress.
 type ProgressCallback func(event ProgressEvent)
 
+// noopProgress is the shared fallback when GenerateOptions.OnProgress is nil,.
+// so callers that don't care about progress don't cost a fresh closure per call.
+var noopProgress ProgressCallback = func(ProgressEvent) {}
+
 // ProgressEvent represents a progress update.
 type ProgressEvent struct {
 	Type     ProgressEventType
@@ -160,8 +164,7 @@ func BuildDummyBOM() ([]DiscoveredBOM, error) {
 	}
 
 	// Build dataset components for any datasets referenced in the model's training metadata.
-	noProgress := func(ProgressEvent) {}
-	buildDatasetComponents(fetchers, bom, extractDatasetsFromModel(apiResp, readme), "dummy-org/dummy-model", noProgress)
+	buildDatasetComponents(fetchers, bom, extractDatasetsFromModel(apiResp, readme), "dummy-org/dummy-model", noopProgress)
 
 	// Add dependencies from model to datasets.
 	builder.AddDependencies(bom)
@@ -185,7 +188,7 @@ func BuildPerDiscovery(discoveries []scanner.Discovery, opts GenerateOptions) ([
 
 	progress := opts.OnProgress
 	if progress == nil {
-		progress = func(ProgressEvent) {}
+		progress = noopProgress
 	}
 
 	results := make([]DiscoveredBOM, 0, len(discoveries))
@@ -339,6 +342,7 @@ func extractDatasetsFromModel(modelResp *fetcher.ModelAPIResponse, readme *fetch
 // the references are still preserved in the model's modelCard metadata.
 func buildDatasetComponents(fetchers fetcherSet, bom *cdx.BOM, datasets []string, modelID string, progress ProgressCallback) int {
 	count := 0
+	bomBuilder := newBOMBuilder()
 	for _, dsID := range datasets {
 		progress(ProgressEvent{Type: EventDatasetStart, ModelID: modelID, Message: dsID})
 
@@ -357,7 +361,7 @@ func buildDatasetComponents(fetchers fetcherSet, bom *cdx.BOM, datasets []string
 			Readme:    dsReadme,
 		}
 
-		dsComp, err := newBOMBuilder().BuildDataset(dsCtx)
+		dsComp, err := bomBuilder.BuildDataset(dsCtx)
 		if err != nil {
 			continue
 		}
@@ -382,12 +386,13 @@ func BuildFromModelIDs(modelIDs []string, opts GenerateOptions) ([]DiscoveredBOM
 
 	progress := opts.OnProgress
 	if progress == nil {
-		progress = func(ProgressEvent) {} // no-op
+		progress = noopProgress
 	}
 
 	results := make([]DiscoveredBOM, 0, len(modelIDs))
 
 	fetchers := newFetcherSet(newHTTPClient(opts))
+	bomBuilder := newBOMBuilder()
 
 	for i, modelID := range modelIDs {
 		modelID = strings.TrimSpace(modelID)
@@ -416,8 +421,6 @@ func BuildFromModelIDs(modelIDs []string, opts GenerateOptions) ([]DiscoveredBOM
 			continue
 		}
 
-		bomBuilder := newBOMBuilder()
-
 		// Fetch README.
 		readme, err := fetchers.modelReadme.Fetch(modelID)
 		if err != nil {
@@ -2,6 +2,7 @@ package merger
 
 import (
 	"fmt"
+	"sort"
 	"strings"
 
 	cdx "github.com/CycloneDX/cyclonedx-go"
@@ -59,9 +60,17 @@ func Merge(primary, secondary *cdx.BOM, opts MergeOptions) (*MergeResult, error)
 	// Merge metadata.
 	result.MergedBOM.Metadata = mergeMetadata(primary.Metadata, secondary.Metadata, opts)
 
-	// Collect all components from both BOMs.
-	componentsMap := make(map[string]*cdx.Component)
-	var mergedComponents []cdx.Component
+	// Collect all components from both BOMs. Pre-size for the no-duplicate.
+	// case so appends do not repeatedly grow and copy the backing array.
+	capHint := 0
+	if primary.Components != nil {
+		capHint += len(*primary.Components)
+	}
+	if secondary.Components != nil {
+		capHint += len(*secondary.Components)
+	}
+	componentsMap := make(map[string]*cdx.Component, capHint)
+	mergedComponents := make([]cdx.Component, 0, capHint)
 
 	// Add primary BOM components.
 	if primary.Components != nil {
@@ -221,9 +230,22 @@ func MergeAIBOMsWithSBOM(sbom *cdx.BOM, aiboms []*cdx.BOM, opts MergeOptions) (*
 		}
 	}
 
-	// Collect all components from SBOM.
-	componentsMap := make(map[string]*cdx.Component)
-	var mergedComponents []cdx.Component
+	// Collect all components from SBOM. Pre-size for the no-duplicate case.
+	// so appends do not repeatedly grow and copy the backing array.
+	capHint := 0
+	if sbom.Components != nil {
+		capHint += len(*sbom.Components)
+	}
+	for _, aibom := range aiboms {
+		if aibom.Metadata != nil && aibom.Metadata.Component != nil {
+			capHint++
+		}
+		if aibom.Components != nil {
+			capHint += len(*aibom.Components)
+		}
+	}
+	componentsMap := make(map[string]*cdx.Component, capHint)
+	mergedComponents := make([]cdx.Component, 0, capHint)
 
 	// Add SBOM components (software libraries, etc.).
 	if sbom.Components != nil {
@@ -483,15 +505,28 @@ func mergeDependencies(primary, secondary *[]cdx.Dependency) *[]cdx.Dependency {
 	}
 
 	// Convert map back to slice.
-	var merged []cdx.Dependency
-	for _, dep := range depMap {
-		merged = append(merged, *dep)
+	merged := sortedDependencies(depMap)
+	if merged == nil {
+		return nil
 	}
 
-	if len(merged) == 0 {
+	return merged
+}
+
+// sortedDependencies flattens a ref-keyed dependency map into a slice ordered.
+// by Ref. Sorting once here keeps merged output deterministic (and diffable).
+// instead of following Go's randomized map iteration order.
+func sortedDependencies(depMap map[string]*cdx.Dependency) *[]cdx.Dependency {
+	if len(depMap) == 0 {
 		return nil
 	}
 
+	merged := make([]cdx.Dependency, 0, len(depMap))
+	for _, dep := range depMap {
+		merged = append(merged, *dep)
+	}
+	sort.Slice(merged, func(i, j int) bool { return merged[i].Ref < merged[j].Ref })
+
 	return &merged
 }
 
@@ -712,16 +747,7 @@ func mergeDependenciesMultiple(deps ...*[]cdx.Dependency) *[]cdx.Dependency {
 		}
 	}
 
-	if len(depMap) == 0 {
-		return nil
-	}
-
-	var merged []cdx.Dependency
-	for _, dep := range depMap {
-		merged = append(merged, *dep)
-	}
-
-	return &merged
+	return sortedDependencies(depMap)
 }
 
 // mergeCompositionsMultiple combines compositions from multiple BOMs.
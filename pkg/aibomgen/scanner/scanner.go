@@ -2,7 +2,9 @@ package scanner
 
 import (
 	"bufio"
+	"bytes"
 	"encoding/json"
+	"io"
 	"io/fs"
 	"os"
 	"path/filepath"
@@ -64,9 +66,20 @@ var (
 
 	// jsRules apply to JavaScript / TypeScript (.js, .ts, .mjs, .cjs).
 	jsRules []detectionRule
+
+	// mdInlinePattern matches bare org/model references in Markdown prose.
+	// Compiled alongside the rule sets so scanMarkdown does not recompile.
+	// it for every file.
+	mdInlinePattern *regexp.Regexp
 )
 
-func init() {
+// compileRulesOnce guards compileRules so the ~40 detection regexes are only.
+// compiled when a scan actually runs. This package is imported (transitively).
+// by every subcommand, so compiling at package init would tax even invocations.
+// that never scan anything (e.g. `validate`, `merge`, `--help`).
+var compileRulesOnce sync.Once
+
+func compileRules() {
 	// ── Python / code rules ─────────────────────────────────────────────────.
 
 	// Generic positional: .from_pretrained("model-id").
@@ -323,6 +336,9 @@ func init() {
 		pattern:  regexp.MustCompile(`\bmodel\s*:\s*["'](` + hfIDSlashPat + `)["']`),
 		groupIdx: 1,
 	})
+
+	// ── Markdown inline pattern (used by scanMarkdown outside front matter) ──.
+	mdInlinePattern = regexp.MustCompile(`\b(` + hfIDSlashPat + `)\b`)
 }
 
 // Scan walks root and returns deduplicated discovered HF model references.
@@ -334,6 +350,8 @@ func init() {
 // (ID, Path). Hidden directories, virtual environments, and common build.
 // output directories are skipped automatically.
 func Scan(root string) ([]Discovery, error) {
+	compileRulesOnce.Do(compileRules)
+
 	// Collect file paths first (fast, serial walk).
 	var paths []string
 	err := filepath.WalkDir(root, func(path string, d fs.DirEntry, err error) error {
@@ -371,8 +389,10 @@ func Scan(root string) ([]Discovery, error) {
 	}
 	close(pathCh)
 
+	// Merge worker hits straight into the dedup index instead of collecting.
+	// them into an intermediate slice that dedupe would walk again.
 	var mu sync.Mutex
-	var results []Discovery
+	index := make(map[discoveryKey]Discovery)
 	var wg sync.WaitGroup
 
 	for i := 0; i < numWorkers; i++ {
@@ -383,7 +403,9 @@ func Scan(root string) ([]Discovery, error) {
 				hits := scanFile(p)
 				if len(hits) > 0 {
 					mu.Lock()
-					results = append(results, hits...)
+					for _, h := range hits {
+						mergeDiscovery(index, h)
+					}
 					mu.Unlock()
 				}
 			}
@@ -391,7 +413,11 @@ func Scan(root string) ([]Discovery, error) {
 	}
 	wg.Wait()
 
-	return dedupe(results), nil
+	out := make([]Discovery, 0, len(index))
+	for _, v := range index {
+		out = append(out, v)
+	}
+	return out, nil
 }
 
 // fileClass categorises a file so we know which rule-set to apply.
@@ -460,6 +486,8 @@ func shouldSkipDir(name string) bool {
 
 // scanFile dispatches a single file to the appropriate scanner.
 func scanFile(path string) []Discovery {
+	compileRulesOnce.Do(compileRules)
+
 	name := strings.ToLower(filepath.Base(path))
 	ext := strings.ToLower(filepath.Ext(name))
 	class := classifyFile(ext, name)
@@ -499,8 +527,15 @@ func scanLines(path string, rules []detectionRule, multiLine bool) []Discovery {
 	}
 	defer f.Close()
 
+	return scanReader(f, path, rules, multiLine)
+}
+
+// scanReader applies rules to r line by line; it backs scanLines and lets.
+// callers that already hold the file contents in memory (scanNotebook's.
+// malformed-notebook fallback) scan without re-reading the file from disk.
+func scanReader(r io.Reader, path string, rules []detectionRule, multiLine bool) []Discovery {
 	var results []Discovery
-	sc := bufio.NewScanner(f)
+	sc := bufio.NewScanner(r)
 	lineNum := 0
 
 	// Multi-line accumulation state (only used when multiLine=true).
@@ -553,6 +588,11 @@ func scanLines(path string, rules []detectionRule, multiLine bool) []Discovery {
 
 // applyRules tests a single text string against all rules and appends any hits.
 func applyRules(results []Discovery, rules []detectionRule, text string, lineNum int, path string) []Discovery {
+	// The line-number/text suffix of the evidence string is identical for.
+	// every match on this line; format it once on the first match instead of.
+	// re-running Itoa and TrimSpace per rule hit (and not at all for the.
+	// common case of a line with no matches).
+	lineInfo := ""
 	for _, rule := range rules {
 		matches := rule.pattern.FindAllStringSubmatch(text, -1)
 		for _, m := range matches {
@@ -563,7 +603,10 @@ func applyRules(results []Discovery, rules []detectionRule, text string, lineNum
 			if !isPlausibleModelID(modelID) {
 				continue
 			}
-			evidence := rule.method + " at line " + strconv.Itoa(lineNum) + ": " + strings.TrimSpace(text)
+			if lineInfo == "" {
+				lineInfo = " at line " + strconv.Itoa(lineNum) + ": " + strings.TrimSpace(text)
+			}
+			evidence := rule.method + lineInfo
 			results = append(results, Discovery{
 				ID:       modelID,
 				Name:     modelID,
@@ -595,8 +638,9 @@ func scanNotebook(path string) []Discovery {
 
 	var nb notebookFormat
 	if err := json.Unmarshal(data, &nb); err != nil {
-		// Fall back to a raw line scan with code rules if parse fails.
-		return scanLines(path, codeRules, true)
+		// Fall back to a raw line scan with code rules if parse fails,.
+		// reusing the bytes already read instead of reopening the file.
+		return scanReader(bytes.NewReader(data), path, codeRules, true)
 	}
 
 	var results []Discovery
@@ -687,9 +731,6 @@ func scanMarkdown(path string) []Discovery {
 	}
 	defer f.Close()
 
-	// Inline pattern for bare org/model references in prose.
-	inlinePattern := regexp.MustCompile(`\b(` + hfIDSlashPat + `)\b`)
-
 	var results []Discovery
 	sc := bufio.NewScanner(f)
 	lineNum := 0
@@ -724,7 +765,7 @@ func scanMarkdown(path string) []Discovery {
 
 		// Body of the document – scan for inline org/model references.
 		if frontmatterClosed || !inFrontmatter {
-			matches := inlinePattern.FindAllStringSubmatch(line, -1)
+			matches := mdInlinePattern.FindAllStringSubmatch(line, -1)
 			for _, m := range matches {
 				if len(m) < 2 {
 					continue
@@ -766,20 +807,34 @@ func isPlausibleModelID(id string) bool {
 
 var versRe = regexp.MustCompile(`^\d+\.\d+`)
 
+// discoveryKey identifies a discovery for deduplication. A comparable struct.
+// hashes the two fields in place, instead of allocating a concatenated string.
+// key per hit.
+type discoveryKey struct {
+	typ string
+	id  string
+}
+
+// mergeDiscovery folds a single discovery into the dedup index keyed by.
+// Type+ID, concatenating distinct evidence strings.
+func mergeDiscovery(index map[discoveryKey]Discovery, c Discovery) {
+	key := discoveryKey{typ: c.Type, id: c.ID}
+	if existing, ok := index[key]; ok {
+		if !strings.Contains(existing.Evidence, c.Evidence) {
+			existing.Evidence += ". " + c.Evidence
+		}
+		// Keep the first seen Method; additional methods are visible via Evidence.
+		index[key] = existing
+	} else {
+		index[key] = c
+	}
+}
+
 // dedupe merges discoveries with identical Type+ID, concatenating distinct evidence strings.
 func dedupe(components []Discovery) []Discovery {
-	index := make(map[string]Discovery)
+	index := make(map[discoveryKey]Discovery)
 	for _, c := range components {
-		key := c.Type + "::" + c.ID
-		if existing, ok := index[key]; ok {
-			if !strings.Contains(existing.Evidence, c.Evidence) {
-				existing.Evidence += ". " + c.Evidence
-			}
-			// Keep the first seen Method; additional methods are visible via Evidence.
-			index[key] = existing
-		} else {
-			index[key] = c
-		}
+		mergeDiscovery(index, c)
 	}
 	out := make([]Discovery, 0, len(index))
 	for _, v := range index {
@@ -46,13 +46,19 @@ type ValidationOptions struct {
 // Validate checks the structural and completeness properties of bom.
 // It returns a [ValidationResult] with errors and warnings; Valid is false.
 // when any hard error is found or when strict-mode thresholds are not met.
+// Type-level validation is already enforced by the cyclonedx-go schema.
+// decode in bomio.ReadBOM (malformed documents never reach this point),.
+// so the checks here are purely semantic: presence, spec version ranges.
+// and completeness scoring.
 func Validate(bom *cdx.BOM, opts ValidationOptions) ValidationResult {
 
+	// DatasetResults is allocated lazily below: the common case is a BOM.
+	// without dataset components, and a nil map behaves like an empty one.
+	// for reads.
 	result := ValidationResult{
-		Valid:          true,
-		Errors:         []string{},
-		Warnings:       []string{},
-		DatasetResults: make(map[string]DatasetValidationResult),
+		Valid:    true,
+		Errors:   []string{},
+		Warnings: []string{},
 	}
 
 	// 1. Basic structural validation.
@@ -107,6 +113,9 @@ func Validate(bom *cdx.BOM, opts ValidationOptions) ValidationResult {
 	}
 
 	// 8. Validate dataset components if they exist.
+	if len(completenessResult.DatasetResults) > 0 {
+		result.DatasetResults = make(map[string]DatasetValidationResult, len(completenessResult.DatasetResults))
+	}
 	for dsName, dsCompletenessResult := range completenessResult.DatasetResults {
 		dsResult := DatasetValidationResult{
 			DatasetRef:        dsCompletenessResult.DatasetRef,